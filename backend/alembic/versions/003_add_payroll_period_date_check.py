@@ -0,0 +1,40 @@
+"""Add payroll period date check
+
+Revision ID: 003_payroll_period_check
+Revises: 002_add_compliance
+Create Date: 2026-10-16 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_payroll_period_check'
+down_revision = '002_add_compliance'
+branch_labels = None
+depends_on = None
+
+
+def _has_payroll_periods() -> bool:
+    """payroll_periods is created by create_all, so it may not exist yet"""
+    return sa.inspect(op.get_bind()).has_table('payroll_periods')
+
+
+def upgrade() -> None:
+    """Reject payroll periods that end on or before their start date"""
+    if not _has_payroll_periods():
+        return
+    
+    op.create_check_constraint(
+        'ck_payroll_period_dates',
+        'payroll_periods',
+        'period_end > period_start'
+    )
+
+
+def downgrade() -> None:
+    """Drop the payroll period date check"""
+    if not _has_payroll_periods():
+        return
+    
+    op.drop_constraint('ck_payroll_period_dates', 'payroll_periods', type_='check')
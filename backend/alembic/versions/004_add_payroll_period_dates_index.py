@@ -0,0 +1,38 @@
+"""Add payroll period dates index
+
+Revision ID: 004_payroll_period_dates_idx
+Revises: 003_payroll_period_check
+Create Date: 2026-10-16 20:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_payroll_period_dates_idx'
+down_revision = '003_payroll_period_check'
+branch_labels = None
+depends_on = None
+
+
+def _has_payroll_periods() -> bool:
+    """payroll_periods is created by create_all, so it may not exist yet"""
+    return sa.inspect(op.get_bind()).has_table('payroll_periods')
+
+
+def upgrade() -> None:
+    """Replace the period_start index with a composite (period_start, period_end) index"""
+    if not _has_payroll_periods():
+        return
+    
+    op.create_index('idx_payroll_period_dates', 'payroll_periods', ['period_start', 'period_end'])
+    op.drop_index('ix_payroll_periods_period_start', table_name='payroll_periods')
+
+
+def downgrade() -> None:
+    """Restore the single-column period_start index"""
+    if not _has_payroll_periods():
+        return
+    
+    op.create_index('ix_payroll_periods_period_start', 'payroll_periods', ['period_start'])
+    op.drop_index('idx_payroll_period_dates', table_name='payroll_periods')
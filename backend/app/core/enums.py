@@ -0,0 +1,15 @@
+"""
+JERP 2.0 - Enumerations
+Shared enumerations, kept free of ORM imports
+"""
+import enum
+
+
+class PayrollStatus(str, enum.Enum):
+    """Payroll period status enumeration"""
+    DRAFT = "DRAFT"
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    PROCESSED = "PROCESSED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
@@ -22,6 +22,7 @@ Enterprise Resource Planning System with Compliance Focus
 from datetime import datetime
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 import sqlalchemy as sa
 
@@ -36,6 +37,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -4,7 +4,7 @@ Database models for compliance tracking and violations
 """
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum as SQLEnum, Numeric, Boolean, Date
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum as SQLEnum, Numeric, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.core.database import Base
@@ -54,11 +54,13 @@ class ComplianceViolation(Base):
     # Violation classification
     violation_type = Column(SQLEnum(ViolationType), nullable=False, index=True)
     regulation = Column(String(255), nullable=False, index=True)
-    severity = Column(SQLEnum(ViolationSeverity), nullable=False, index=True)
+    # severity is served by the leading column of idx_compliance_violation_severity_status
+    severity = Column(SQLEnum(ViolationSeverity), nullable=False)
     
     # Violation details
     description = Column(Text, nullable=False)
-    entity_type = Column(String(100), nullable=False, index=True)
+    # entity_type is served by the leading column of idx_compliance_violation_entity
+    entity_type = Column(String(100), nullable=False)
     entity_id = Column(Integer, nullable=True, index=True)
     
     # Timestamps
@@ -86,6 +88,11 @@ class ComplianceViolation(Base):
     def __repr__(self):
         return f"<ComplianceViolation(id={self.id}, type='{self.violation_type}', severity='{self.severity}')>"
 
+    __table_args__ = (
+        Index('idx_compliance_violation_entity', 'entity_type', 'entity_id'),
+        Index('idx_compliance_violation_severity_status', 'severity', 'status'),
+    )
+
 
 class ComplianceRule(Base):
     """
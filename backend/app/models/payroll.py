@@ -3,7 +3,7 @@ JERP 2.0 - Payroll Models
 Payroll period and payslip models with FLSA/CA Labor Code compliance tracking
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Date, Numeric, Text, Enum as SQLEnum, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Date, Numeric, Text, Enum as SQLEnum, Index, CheckConstraint
 Pay periods, payslips, and payroll management models
 """
 from datetime import datetime
@@ -11,16 +11,7 @@ from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Nume
 from sqlalchemy.orm import relationship
 import enum
 from app.core.database import Base
-
-
-class PayrollStatus(str, enum.Enum):
-    """Payroll period status enumeration"""
-    DRAFT = "DRAFT"
-    PENDING = "PENDING"
-    PROCESSING = "PROCESSING"
-    PROCESSED = "PROCESSED"
-    FAILED = "FAILED"
-    CANCELLED = "CANCELLED"
+from app.core.enums import PayrollStatus
 
 
 class PayrollPeriod(Base):
@@ -30,7 +21,7 @@ class PayrollPeriod(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     
     # Period dates
-    period_start = Column(Date, nullable=False, index=True)
+    period_start = Column(Date, nullable=False)
     period_end = Column(Date, nullable=False, index=True)
     pay_date = Column(Date, nullable=False)
     
@@ -49,6 +40,11 @@ class PayrollPeriod(Base):
     
     # Notes
     notes = Column(Text, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint('period_end > period_start', name='ck_payroll_period_dates'),
+        Index('idx_payroll_period_dates', 'period_start', 'period_end'),
+    )
 class PayPeriodStatus(str, enum.Enum):
     """Pay period status enumeration"""
     OPEN = "OPEN"
@@ -93,11 +89,6 @@ class PayPeriod(Base):
     def __repr__(self):
         return f"<PayrollPeriod(id={self.id}, period={self.period_start} to {self.period_end}, status='{self.status}')>"
 
-    __table_args__ = (
-        Index('idx_payroll_period_dates', 'period_start', 'period_end'),
-        Index('idx_payroll_period_status', 'status'),
-    )
-
 
 class Payslip(Base):
     """Payslip model with comprehensive pay calculations and compliance tracking"""
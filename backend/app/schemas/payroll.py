@@ -7,7 +7,7 @@ from typing import Optional
 from datetime import datetime, date
 from decimal import Decimal
 
-from app.models.payroll import PayrollStatus
+from app.core.enums import PayrollStatus
 
 
 # PayrollPeriod Schemas
@@ -11,7 +11,7 @@ import os
 import logging
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 from app.core.database import SessionLocal, Base, jerp_engine
 from app.models.user import User
@@ -93,53 +93,64 @@ ROLE_PERMISSION_MAPPING = {
 
 def create_default_roles(db: Session) -> dict:
     """Create default roles if they don't exist"""
-    created_roles = {}
+    names = [role_data["name"] for role_data in DEFAULT_ROLES]
+    existing = {
+        name for (name,) in db.query(Role.name).filter(Role.name.in_(names))
+    }
     
-    for role_data in DEFAULT_ROLES:
-        existing_role = db.query(Role).filter(Role.name == role_data["name"]).first()
-        
-        if not existing_role:
-            role = Role(
-                name=role_data["name"],
-                description=role_data["description"],
-                is_active=True
-            )
-            db.add(role)
-            db.flush()
-            created_roles[role.name] = role
-            logger.info(f"Created role: {role.name}")
+    missing = [
+        {
+            "name": role_data["name"],
+            "description": role_data["description"],
+            "is_active": True
+        }
+        for role_data in DEFAULT_ROLES
+        if role_data["name"] not in existing
+    ]
+    if missing:
+        db.execute(insert(Role), missing)
+    
+    for name in names:
+        if name in existing:
+            logger.info(f"Role already exists: {name}")
         else:
-            created_roles[existing_role.name] = existing_role
-            logger.info(f"Role already exists: {existing_role.name}")
+            logger.info(f"Created role: {name}")
     
     db.commit()
-    return created_roles
+    return {role.name: role for role in db.query(Role).filter(Role.name.in_(names))}
 
 
 def create_default_permissions(db: Session) -> dict:
     """Create default permissions if they don't exist"""
-    created_permissions = {}
+    codes = [perm_data["code"] for perm_data in DEFAULT_PERMISSIONS]
+    existing = {
+        code for (code,) in db.query(Permission.code).filter(Permission.code.in_(codes))
+    }
     
-    for perm_data in DEFAULT_PERMISSIONS:
-        existing_perm = db.query(Permission).filter(Permission.code == perm_data["code"]).first()
-        
-        if not existing_perm:
-            permission = Permission(
-                code=perm_data["code"],
-                name=perm_data["name"],
-                description=perm_data.get("description", ""),
-                module=perm_data["module"]
-            )
-            db.add(permission)
-            db.flush()
-            created_permissions[permission.code] = permission
-            logger.info(f"Created permission: {permission.code}")
+    missing = [
+        {
+            "code": perm_data["code"],
+            "name": perm_data["name"],
+            "description": perm_data.get("description", ""),
+            "module": perm_data["module"]
+        }
+        for perm_data in DEFAULT_PERMISSIONS
+        if perm_data["code"] not in existing
+    ]
+    if missing:
+        db.execute(insert(Permission), missing)
+    
+    for code in codes:
+        if code in existing:
+            logger.info(f"Permission already exists: {code}")
         else:
-            created_permissions[existing_perm.code] = existing_perm
-            logger.info(f"Permission already exists: {existing_perm.code}")
+            logger.info(f"Created permission: {code}")
     
     db.commit()
-    return created_permissions
+    return {
+        permission.code: permission
+        for permission in db.query(Permission).filter(Permission.code.in_(codes))
+    }
 
 
 def assign_permissions_to_roles(db: Session, roles: dict, permissions: dict):
@@ -6,6 +6,13 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Dict, Any
 
+DAILY_OVERTIME_THRESHOLD = Decimal("8")  # Daily hours before 1.5x overtime
+DAILY_DOUBLE_TIME_THRESHOLD = Decimal("12")  # Daily hours before 2x overtime
+DAILY_OVERTIME_BAND = DAILY_DOUBLE_TIME_THRESHOLD - DAILY_OVERTIME_THRESHOLD  # Hours 8-12
+WEEKLY_OVERTIME_THRESHOLD = Decimal("40")  # Weekly hours before 1.5x overtime
+PENALTY_HOUR = Decimal("1")  # One hour of pay per break violation day
+ZERO = Decimal("0")
+
 
 def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime]) -> Dict[str, Any]:
     """
@@ -24,16 +31,16 @@ def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime])
         Dict with regular_hours, overtime_1_5x_hours, overtime_2x_hours, and violations
     """
     result = {
-        "regular_hours": Decimal("0"),
-        "overtime_1_5x_hours": Decimal("0"),
-        "overtime_2x_hours": Decimal("0"),
+        "regular_hours": ZERO,
+        "overtime_1_5x_hours": ZERO,
+        "overtime_2x_hours": ZERO,
         "daily_breakdown": {},
         "violations": []
     }
     
     # Sort workweek to identify consecutive days
     sorted_dates = sorted([d.strftime("%Y-%m-%d") for d in workweek])
-    total_weekly_hours = Decimal("0")
+    total_weekly_hours = ZERO
     
     # Track consecutive work days
     consecutive_days = 0
@@ -59,9 +66,9 @@ def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime])
         
         last_date = date_str
         
-        daily_regular = Decimal("0")
-        daily_ot_1_5x = Decimal("0")
-        daily_ot_2x = Decimal("0")
+        daily_regular = ZERO
+        daily_ot_1_5x = ZERO
+        daily_ot_2x = ZERO
         
         # 7th consecutive day special rules
         if consecutive_days >= 7:
@@ -70,8 +77,8 @@ def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime])
                 daily_ot_1_5x = hours
             else:
                 # 1.5x for first 8 hours, 2x for hours beyond 8
-                daily_ot_1_5x = Decimal("8")
-                daily_ot_2x = hours - Decimal("8")
+                daily_ot_1_5x = DAILY_OVERTIME_THRESHOLD
+                daily_ot_2x = hours - DAILY_OVERTIME_THRESHOLD
             
             result["violations"].append({
                 "date": date_str,
@@ -84,12 +91,12 @@ def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime])
             if hours <= 8:
                 daily_regular = hours
             elif hours <= 12:
-                daily_regular = Decimal("8")
-                daily_ot_1_5x = hours - Decimal("8")
+                daily_regular = DAILY_OVERTIME_THRESHOLD
+                daily_ot_1_5x = hours - DAILY_OVERTIME_THRESHOLD
             else:
-                daily_regular = Decimal("8")
-                daily_ot_1_5x = Decimal("4")  # Hours 8-12
-                daily_ot_2x = hours - Decimal("12")
+                daily_regular = DAILY_OVERTIME_THRESHOLD
+                daily_ot_1_5x = DAILY_OVERTIME_BAND
+                daily_ot_2x = hours - DAILY_DOUBLE_TIME_THRESHOLD
         
         result["daily_breakdown"][date_str] = {
             "regular": float(daily_regular),
@@ -106,7 +113,7 @@ def calculate_overtime(hours_worked: Dict[str, float], workweek: List[datetime])
     # Apply weekly overtime rule (>40 hours)
     # Convert regular hours to overtime 1.5x if weekly total exceeds 40
     if total_weekly_hours > 40:
-        excess_hours = total_weekly_hours - Decimal("40")
+        excess_hours = total_weekly_hours - WEEKLY_OVERTIME_THRESHOLD
         if result["regular_hours"] > 0:
             hours_to_convert = min(result["regular_hours"], excess_hours)
             result["regular_hours"] -= hours_to_convert
@@ -302,7 +309,7 @@ def calculate_penalties(violations: List[Dict[str, Any]]) -> Decimal:
     Returns:
         Decimal penalty amount in hours of pay
     """
-    penalty_hours = Decimal("0")
+    penalty_hours = ZERO
     
     violation_types_counted = set()
     
@@ -311,12 +318,12 @@ def calculate_penalties(violations: List[Dict[str, Any]]) -> Decimal:
         
         # Meal break violations - 1 hour penalty per day
         if "MEAL_BREAK" in violation_type and "MEAL_BREAK" not in violation_types_counted:
-            penalty_hours += Decimal("1")
+            penalty_hours += PENALTY_HOUR
             violation_types_counted.add("MEAL_BREAK")
         
         # Rest break violations - 1 hour penalty per day
         if "REST_BREAK" in violation_type and "REST_BREAK" not in violation_types_counted:
-            penalty_hours += Decimal("1")
+            penalty_hours += PENALTY_HOUR
             violation_types_counted.add("REST_BREAK")
     
     return penalty_hours
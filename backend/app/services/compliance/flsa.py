@@ -12,6 +12,9 @@ FEDERAL_MINIMUM_WAGE = Decimal("7.25")  # Current federal minimum wage
 TIPPED_MINIMUM_CASH_WAGE = Decimal("2.13")  # Minimum cash wage for tipped employees
 TIPPED_CREDIT_MAX = Decimal("5.12")  # Maximum tip credit
 YOUTH_MINIMUM_WAGE = Decimal("4.25")  # Youth minimum wage (first 90 days, under 20)
+OVERTIME_THRESHOLD = Decimal("40")  # Weekly hours before overtime applies
+OVERTIME_MULTIPLIER = Decimal("1.5")  # Time-and-a-half
+ZERO = Decimal("0")
 
 
 def calculate_flsa_overtime(hours_worked: float, regular_rate: Decimal) -> Dict[str, Any]:
@@ -31,9 +34,9 @@ def calculate_flsa_overtime(hours_worked: float, regular_rate: Decimal) -> Dict[
     result = {
         "regular_hours": 0.0,
         "overtime_hours": 0.0,
-        "regular_pay": Decimal("0"),
-        "overtime_pay": Decimal("0"),
-        "total_pay": Decimal("0"),
+        "regular_pay": ZERO,
+        "overtime_pay": ZERO,
+        "total_pay": ZERO,
         "violations": []
     }
     
@@ -44,9 +47,9 @@ def calculate_flsa_overtime(hours_worked: float, regular_rate: Decimal) -> Dict[
         result["regular_pay"] = hours * regular_rate
     else:
         result["regular_hours"] = 40.0
-        result["overtime_hours"] = float(hours - Decimal("40"))
-        result["regular_pay"] = Decimal("40") * regular_rate
-        result["overtime_pay"] = (hours - Decimal("40")) * regular_rate * Decimal("1.5")
+        result["overtime_hours"] = float(hours - OVERTIME_THRESHOLD)
+        result["regular_pay"] = OVERTIME_THRESHOLD * regular_rate
+        result["overtime_pay"] = (hours - OVERTIME_THRESHOLD) * regular_rate * OVERTIME_MULTIPLIER
     
     result["total_pay"] = result["regular_pay"] + result["overtime_pay"]
     
@@ -73,8 +76,8 @@ def validate_minimum_wage(pay: Decimal, hours: float, employee_type: str = "regu
     result = {
         "compliant": True,
         "violations": [],
-        "effective_rate": Decimal("0"),
-        "minimum_required": Decimal("0")
+        "effective_rate": ZERO,
+        "minimum_required": ZERO
     }
     
     if hours == 0:
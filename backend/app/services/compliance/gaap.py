@@ -6,6 +6,10 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Dict, Any, List
 
+BALANCE_TOLERANCE = Decimal("0.01")  # Largest rounding difference treated as balanced
+DOUBLE_DECLINING_FACTOR = Decimal("2")
+ZERO = Decimal("0")
+
 
 def validate_balance_sheet(assets: Dict[str, Decimal], liabilities: Dict[str, Decimal], equity: Dict[str, Decimal]) -> Dict[str, Any]:
     """
@@ -22,10 +26,10 @@ def validate_balance_sheet(assets: Dict[str, Decimal], liabilities: Dict[str, De
     result = {
         "compliant": True,
         "violations": [],
-        "total_assets": Decimal("0"),
-        "total_liabilities": Decimal("0"),
-        "total_equity": Decimal("0"),
-        "balance": Decimal("0")
+        "total_assets": ZERO,
+        "total_liabilities": ZERO,
+        "total_equity": ZERO,
+        "balance": ZERO
     }
     
     # Calculate totals
@@ -38,7 +42,7 @@ def validate_balance_sheet(assets: Dict[str, Decimal], liabilities: Dict[str, De
     result["balance"] = result["total_assets"] - liabilities_plus_equity
     
     # Allow for small rounding differences (1 cent)
-    if abs(result["balance"]) > Decimal("0.01"):
+    if abs(result["balance"]) > BALANCE_TOLERANCE:
         result["compliant"] = False
         result["violations"].append({
             "type": "BALANCE_SHEET_IMBALANCE",
@@ -48,8 +52,8 @@ def validate_balance_sheet(assets: Dict[str, Decimal], liabilities: Dict[str, De
         })
     
     # Validate asset classifications
-    current_assets = Decimal("0")
-    non_current_assets = Decimal("0")
+    current_assets = ZERO
+    non_current_assets = ZERO
     
     for account, amount in assets.items():
         account_lower = account.lower()
@@ -59,8 +63,8 @@ def validate_balance_sheet(assets: Dict[str, Decimal], liabilities: Dict[str, De
             non_current_assets += Decimal(str(amount))
     
     # Validate liability classifications
-    current_liabilities = Decimal("0")
-    non_current_liabilities = Decimal("0")
+    current_liabilities = ZERO
+    non_current_liabilities = ZERO
     
     for account, amount in liabilities.items():
         account_lower = account.lower()
@@ -102,9 +106,9 @@ def validate_journal_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     result = {
         "compliant": True,
         "violations": [],
-        "total_debits": Decimal("0"),
-        "total_credits": Decimal("0"),
-        "balance": Decimal("0")
+        "total_debits": ZERO,
+        "total_credits": ZERO,
+        "balance": ZERO
     }
     
     debits = entry.get("debits", [])
@@ -141,7 +145,7 @@ def validate_journal_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     # Validate debits = credits
     result["balance"] = result["total_debits"] - result["total_credits"]
     
-    if abs(result["balance"]) > Decimal("0.01"):
+    if abs(result["balance"]) > BALANCE_TOLERANCE:
         result["compliant"] = False
         result["violations"].append({
             "type": "UNBALANCED_ENTRY",
@@ -218,7 +222,7 @@ def validate_revenue_recognition(transaction: Dict[str, Any]) -> Dict[str, Any]:
     result = {
         "compliant": True,
         "violations": [],
-        "revenue_recognizable": Decimal("0")
+        "revenue_recognizable": ZERO
     }
     
     # Step 1: Validate contract exists
@@ -254,7 +258,7 @@ def validate_revenue_recognition(transaction: Dict[str, Any]) -> Dict[str, Any]:
         })
     
     # Step 4 & 5: Calculate recognizable revenue based on satisfied obligations
-    total_allocated = Decimal("0")
+    total_allocated = ZERO
     
     for obligation in performance_obligations:
         allocated_price = Decimal(str(obligation.get("allocated_price", 0)))
@@ -283,7 +287,7 @@ def validate_revenue_recognition(transaction: Dict[str, Any]) -> Dict[str, Any]:
         total_allocated += allocated_price
     
     # Validate allocation equals transaction price
-    if transaction_price and abs(total_allocated - Decimal(str(transaction_price))) > Decimal("0.01"):
+    if transaction_price and abs(total_allocated - Decimal(str(transaction_price))) > BALANCE_TOLERANCE:
         result["violations"].append({
             "type": "ALLOCATION_MISMATCH",
             "description": f"Allocated amounts ({total_allocated}) don't match transaction price ({transaction_price})",
@@ -316,8 +320,8 @@ def validate_depreciation(asset: Dict[str, Any], method: str) -> Dict[str, Any]:
     result = {
         "compliant": True,
         "violations": [],
-        "annual_depreciation": Decimal("0"),
-        "depreciation_expense": Decimal("0")
+        "annual_depreciation": ZERO,
+        "depreciation_expense": ZERO
     }
     
     cost = Decimal(str(asset.get("cost", 0)))
@@ -369,13 +373,13 @@ def validate_depreciation(asset: Dict[str, Any], method: str) -> Dict[str, Any]:
     if method.lower() == "straight-line":
         result["annual_depreciation"] = depreciable_base / Decimal(str(useful_life))
     elif method.lower() in ["double-declining", "double declining balance", "ddb"]:
-        rate = Decimal("2") / Decimal(str(useful_life))
+        rate = DOUBLE_DECLINING_FACTOR / Decimal(str(useful_life))
         book_value = cost - accumulated_depreciation
         result["annual_depreciation"] = book_value * rate
         
         # Ensure doesn't depreciate below salvage value
         if cost - accumulated_depreciation - result["annual_depreciation"] < salvage_value:
-            result["annual_depreciation"] = max(Decimal("0"), book_value - salvage_value)
+            result["annual_depreciation"] = max(ZERO, book_value - salvage_value)
     else:
         result["violations"].append({
             "type": "UNSUPPORTED_METHOD",
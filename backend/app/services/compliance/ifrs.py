@@ -2,11 +2,45 @@
 JERP 2.0 - IFRS Validation Engine
 Implements International Financial Reporting Standards validation
 """
-from decimal import Decimal
+from decimal import Decimal, Context, ROUND_HALF_EVEN, localcontext
 from datetime import datetime
 from typing import Dict, Any, List
 
 
+# Shared arithmetic context for monetary kernels
+_CTX = Context(prec=18, rounding=ROUND_HALF_EVEN)
+TWOPLACES = Decimal("0.01")
+
+
+def _lease_present_value(months: int, payment: Decimal, annual_rate: Decimal) -> Decimal:
+    """Present value of a stream of monthly lease payments (ordinary annuity)."""
+    with localcontext(_CTX):
+        monthly_rate = annual_rate / Decimal("12") / Decimal("100")
+        
+        if monthly_rate > 0:
+            pv_factor = (Decimal("1") - (Decimal("1") + monthly_rate) ** -months) / monthly_rate
+            present_value = payment * pv_factor
+        else:
+            present_value = payment * Decimal(str(months))
+        
+        return present_value.quantize(TWOPLACES)
+
+
+def _dcf(cash_flows: List[Decimal], rate: Decimal) -> Decimal:
+    """Discount periodic cash flows, the first received at the end of period 1."""
+    with localcontext(_CTX):
+        growth = Decimal("1") + rate
+        factor = growth
+        present_value = Decimal("0")
+        
+        # Carry the compounding factor forward instead of re-raising per period
+        for cash_flow in cash_flows:
+            present_value += cash_flow / factor
+            factor *= growth
+        
+        return present_value.quantize(TWOPLACES)
+
+
 def validate_ifrs15_revenue(contract: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate revenue recognition according to IFRS 15 (Revenue from Contracts with Customers).
@@ -219,14 +253,7 @@ def validate_ifrs16_lease(lease: Dict[str, Any]) -> Dict[str, Any]:
     
     # Calculate present value of lease payments (simplified)
     if discount_rate > 0 and monthly_payment > 0 and lease_term_months > 0:
-        monthly_rate = discount_rate / Decimal("12") / Decimal("100")
-        
-        # Present value of annuity formula
-        if monthly_rate > 0:
-            pv_factor = (Decimal("1") - (Decimal("1") + monthly_rate) ** -lease_term_months) / monthly_rate
-            result["lease_liability"] = monthly_payment * pv_factor
-        else:
-            result["lease_liability"] = monthly_payment * Decimal(str(lease_term_months))
+        result["lease_liability"] = _lease_present_value(lease_term_months, monthly_payment, discount_rate)
         
         # Right-of-use asset = lease liability + initial direct costs + prepayments - incentives
         initial_direct_costs = Decimal(str(lease.get("initial_direct_costs", 0)))
@@ -260,6 +287,27 @@ def validate_ifrs16_lease(lease: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _cost_approach(asset: Dict[str, Any], market_data: Dict[str, Any]) -> Decimal:
+    """Level 3 cost approach: replacement cost less accumulated depreciation."""
+    replacement_cost = Decimal(str(asset.get("replacement_cost", 0)))
+    accumulated_depreciation = Decimal(str(asset.get("accumulated_depreciation", 0)))
+    return replacement_cost - accumulated_depreciation
+
+
+def _income_approach(asset: Dict[str, Any], market_data: Dict[str, Any]) -> Decimal:
+    """Level 3 income approach: discounted future cash flows."""
+    future_cash_flows = [Decimal(str(cf)) for cf in market_data.get("future_cash_flows", [])]
+    discount_rate = Decimal(str(market_data.get("discount_rate", 10))) / Decimal("100")
+    return _dcf(future_cash_flows, discount_rate)
+
+
+# Level 3 valuation techniques keyed by market_data["valuation_method"]
+_FV_DISPATCH = {
+    "cost": _cost_approach,
+    "income": _income_approach,
+}
+
+
 def calculate_fair_value(asset: Dict[str, Any], market_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate fair value according to IFRS 13 (Fair Value Measurement).
@@ -308,24 +356,11 @@ def calculate_fair_value(asset: Dict[str, Any], market_data: Dict[str, Any]) ->
     # Level 3: Unobservable inputs (use cost or income approach)
     else:
         valuation_method = market_data.get("valuation_method", "cost")
+        approach = _FV_DISPATCH.get(valuation_method)
         
-        if valuation_method == "cost":
-            # Cost approach
-            replacement_cost = Decimal(str(asset.get("replacement_cost", 0)))
-            accumulated_depreciation = Decimal(str(asset.get("accumulated_depreciation", 0)))
-            result["fair_value"] = replacement_cost - accumulated_depreciation
-            result["valuation_technique"] = "cost_approach"
-        elif valuation_method == "income":
-            # Income approach (discounted cash flows)
-            future_cash_flows = [Decimal(str(cf)) for cf in market_data.get("future_cash_flows", [])]
-            discount_rate = Decimal(str(market_data.get("discount_rate", 10))) / Decimal("100")
-            
-            present_value = Decimal("0")
-            for i, cash_flow in enumerate(future_cash_flows, start=1):
-                present_value += cash_flow / ((Decimal("1") + discount_rate) ** i)
-            
-            result["fair_value"] = present_value
-            result["valuation_technique"] = "income_approach"
+        if approach is not None:
+            result["fair_value"] = approach(asset, market_data)
+            result["valuation_technique"] = f"{valuation_method}_approach"
         else:
             result["violations"].append({
                 "type": "INVALID_VALUATION_METHOD",
@@ -2,6 +2,7 @@
 JERP 2.0 - Database Initialization Service
 Initialize database with default roles, permissions, and superuser
 """
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.role import Role, Permission
@@ -23,11 +24,14 @@ class DatabaseInitService:
             {"name": "Guest", "description": "Read-only access"},
         ]
         
-        for role_data in roles:
-            exists = db.query(Role).filter(Role.name == role_data["name"]).first()
-            if not exists:
-                role = Role(**role_data)
-                db.add(role)
+        existing = {
+            name for (name,) in db.query(Role.name).filter(
+                Role.name.in_([r["name"] for r in roles])
+            )
+        }
+        missing = [r for r in roles if r["name"] not in existing]
+        if missing:
+            db.execute(insert(Role), missing)
         
         db.commit()
     
@@ -37,18 +41,25 @@ class DatabaseInitService:
         modules = ["users", "roles", "audit", "compliance", "hr", "payroll", "finance"]
         actions = ["create", "read", "update", "delete"]
         
-        for module in modules:
-            for action in actions:
-                code = f"{module}.{action}"
-                exists = db.query(Permission).filter(Permission.code == code).first()
-                if not exists:
-                    permission = Permission(
-                        code=code,
-                        name=f"{action.title()} {module.title()}",
-                        description=f"Permission to {action} {module}",
-                        module=module
-                    )
-                    db.add(permission)
+        permissions = [
+            {
+                "code": f"{module}.{action}",
+                "name": f"{action.title()} {module.title()}",
+                "description": f"Permission to {action} {module}",
+                "module": module
+            }
+            for module in modules
+            for action in actions
+        ]
+        
+        existing = {
+            code for (code,) in db.query(Permission.code).filter(
+                Permission.code.in_([p["code"] for p in permissions])
+            )
+        }
+        missing = [p for p in permissions if p["code"] not in existing]
+        if missing:
+            db.execute(insert(Permission), missing)
         
         db.commit()
     
@@ -6,12 +6,10 @@ from decimal import Decimal
 from app.services.compliance import ifrs
 
 
-class TestIFRS15Revenue:
-    """Test IFRS 15 revenue recognition"""
-    
-    def test_valid_revenue_contract(self):
-        """Test valid IFRS 15 revenue recognition"""
-        contract = {
+# IFRS 15 contracts paired with the expected validation outcome
+IFRS15_CASES = [
+    pytest.param(
+        {
             "customer_id": 12345,
             "has_commercial_substance": True,
             "payment_probable": True,
@@ -23,30 +21,20 @@ class TestIFRS15Revenue:
                     "control_transferred": True
                 }
             ]
-        }
-        
-        result = ifrs.validate_ifrs15_revenue(contract)
-        
-        assert result["compliant"] is True
-        assert result["revenue_recognizable"] == 10000.0
-    
-    def test_no_customer(self):
-        """Test contract without customer identification"""
-        contract = {
+        },
+        {"compliant": True, "revenue_recognizable": 10000.0},
+        id="valid_revenue_contract"
+    ),
+    pytest.param(
+        {
             "transaction_price": 5000,
             "performance_obligations": []
-        }
-        
-        result = ifrs.validate_ifrs15_revenue(contract)
-        
-        assert result["compliant"] is False
-        
-        violations = [v for v in result["violations"] if v["type"] == "NO_CUSTOMER"]
-        assert len(violations) == 1
-    
-    def test_over_time_recognition(self):
-        """Test revenue recognition over time"""
-        contract = {
+        },
+        {"compliant": False, "violation": "NO_CUSTOMER"},
+        id="no_customer"
+    ),
+    pytest.param(
+        {
             "customer_id": 12345,
             "has_commercial_substance": True,
             "payment_probable": True,
@@ -58,16 +46,12 @@ class TestIFRS15Revenue:
                     "progress_percentage": 50
                 }
             ]
-        }
-        
-        result = ifrs.validate_ifrs15_revenue(contract)
-        
-        assert result["compliant"] is True
-        assert result["revenue_recognizable"] == 5000.0  # 50% of 10000
-    
-    def test_invalid_progress(self):
-        """Test invalid progress percentage"""
-        contract = {
+        },
+        {"compliant": True, "revenue_recognizable": 5000.0},  # 50% of 10000
+        id="over_time_recognition"
+    ),
+    pytest.param(
+        {
             "customer_id": 12345,
             "has_commercial_substance": True,
             "payment_probable": True,
@@ -79,64 +63,78 @@ class TestIFRS15Revenue:
                     "progress_percentage": 150  # Invalid: > 100
                 }
             ]
-        }
-        
+        },
+        {"compliant": False, "violation": "INVALID_PROGRESS"},
+        id="invalid_progress"
+    ),
+]
+
+
+class TestIFRS15Revenue:
+    """Test IFRS 15 revenue recognition"""
+    
+    @pytest.mark.parametrize("contract,expect", IFRS15_CASES)
+    def test_ifrs15(self, contract, expect):
+        """Test IFRS 15 revenue recognition outcomes"""
         result = ifrs.validate_ifrs15_revenue(contract)
         
-        assert result["compliant"] is False
+        assert result["compliant"] is expect["compliant"]
         
-        violations = [v for v in result["violations"] if v["type"] == "INVALID_PROGRESS"]
-        assert len(violations) == 1
+        if "revenue_recognizable" in expect:
+            assert result["revenue_recognizable"] == expect["revenue_recognizable"]
+        
+        if "violation" in expect:
+            violations = [v for v in result["violations"] if v["type"] == expect["violation"]]
+            assert len(violations) == 1
 
 
 class TestIFRS16Lease:
     """Test IFRS 16 lease accounting"""
     
-    def test_standard_lease(self):
-        """Test standard lease recognition"""
-        lease = {
-            "lease_term_months": 36,
-            "monthly_payment": Decimal("1000"),
-            "underlying_asset_value": Decimal("30000"),
-            "discount_rate": Decimal("5"),
-            "initial_direct_costs": Decimal("500"),
-            "prepayments": Decimal("0"),
-            "lease_incentives": Decimal("0")
-        }
-        
-        result = ifrs.validate_ifrs16_lease(lease)
-        
-        assert result["compliant"] is True
-        assert result["lease_liability"] > 0
-        assert result["right_of_use_asset"] > 0
-    
-    def test_short_term_exemption(self):
-        """Test short-term lease exemption"""
-        lease = {
-            "lease_term_months": 12,
-            "monthly_payment": Decimal("500"),
-            "underlying_asset_value": Decimal("5000"),
-            "discount_rate": Decimal("5"),
-            "short_term_exemption_elected": True
-        }
-        
+    @pytest.mark.parametrize("lease,exemption", [
+        (
+            {
+                "lease_term_months": 36,
+                "monthly_payment": Decimal("1000"),
+                "underlying_asset_value": Decimal("30000"),
+                "discount_rate": Decimal("5"),
+                "initial_direct_costs": Decimal("500"),
+                "prepayments": Decimal("0"),
+                "lease_incentives": Decimal("0")
+            },
+            None
+        ),
+        (
+            {
+                "lease_term_months": 12,
+                "monthly_payment": Decimal("500"),
+                "underlying_asset_value": Decimal("5000"),
+                "discount_rate": Decimal("5"),
+                "short_term_exemption_elected": True
+            },
+            "short_term"
+        ),
+        (
+            {
+                "lease_term_months": 24,
+                "monthly_payment": Decimal("100"),
+                "underlying_asset_value": Decimal("3000"),
+                "discount_rate": Decimal("5"),
+                "low_value_exemption_elected": True
+            },
+            "low_value"
+        ),
+    ], ids=["standard_lease", "short_term_exemption", "low_value_exemption"])
+    def test_lease_recognition(self, lease, exemption):
+        """Test standard lease recognition and short-term/low-value exemptions"""
         result = ifrs.validate_ifrs16_lease(lease)
         
-        assert result.get("exemption") == "short_term"
-    
-    def test_low_value_exemption(self):
-        """Test low-value asset exemption"""
-        lease = {
-            "lease_term_months": 24,
-            "monthly_payment": Decimal("100"),
-            "underlying_asset_value": Decimal("3000"),
-            "discount_rate": Decimal("5"),
-            "low_value_exemption_elected": True
-        }
-        
-        result = ifrs.validate_ifrs16_lease(lease)
+        assert result.get("exemption") == exemption
         
-        assert result.get("exemption") == "low_value"
+        if exemption is None:
+            assert result["compliant"] is True
+            assert result["lease_liability"] > 0
+            assert result["right_of_use_asset"] > 0
     
     def test_invalid_lease_term(self):
         """Test lease with invalid term"""
@@ -217,7 +215,8 @@ class TestFairValue:
         
         assert result["compliant"] is True
         assert result["hierarchy_level"] == "Level 3"
-        assert result["fair_value"] > 0
+        # 10000/1.1 + 10000/1.1^2 + 10000/1.1^3
+        assert result["fair_value"] == 24868.52
 
 
 class TestImpairment:
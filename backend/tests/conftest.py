@@ -2,47 +2,319 @@
 JERP 2.0 - Test Configuration
 Fixtures and configuration for pytest
 """
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import lru_cache
+
 import pytest
-from sqlalchemy import create_engine
+from passlib.context import CryptContext
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from app.core.database import Base
 from app.main import app
 from app.core.database import get_db
+from app.core import deps, security
+from app.core.security import create_access_token, get_password_hash
+from app.models.role import Role, Permission
+from app.models.user import User
+from app.schemas.auth import ChangePasswordRequest, LoginRequest, RegisterRequest
+from app.schemas.role import PermissionCreate, RoleCreate, RoleUpdate
+from app.schemas.user import UserCreate, UserUpdate
 
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# In-memory SQLite on one shared connection; each pytest-xdist worker is its
+# own process and therefore gets its own private database
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db():
-    """Create a fresh database for each test."""
+@event.listens_for(engine, "connect")
+def _sqlite_connect(dbapi_connection, connection_record):
+    """Hand transaction control to SQLAlchemy so SAVEPOINTs work on pysqlite."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _sqlite_begin(conn):
+    """Emit BEGIN ourselves now that pysqlite no longer does."""
+    conn.exec_driver_sql("BEGIN")
+
+
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Session handed out by the get_db override; set per test by the db fixture
+_db_ctx: ContextVar = ContextVar("db")
+
+# Every endpoint under test speaks JSON; send it as the default Accept header
+JSON_HEADERS = {"Accept": "application/json"}
+
+# Memoized test tokens must outlive the whole test session
+TEST_TOKEN_EXPIRE = timedelta(days=1)
+
+
+@lru_cache(maxsize=16)
+def _signed(sub: int, email: str, role: str = None) -> str:
+    """Sign an access token once per distinct test identity."""
+    return create_access_token(
+        {"sub": str(sub), "email": email, "role": role, "permissions": []},
+        expires_delta=TEST_TOKEN_EXPIRE
+    )
+
+
+def _override_get_db():
+    """Yield the current test's session; the db fixture owns its lifecycle."""
+    session = _db_ctx.get(None)
+    if session is None:
+        # Tests without a db fixture still stay on the in-memory test database
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+    else:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across all async tests in the session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_pw_hash():
+    """Hash test passwords at the minimum bcrypt cost, once per distinct password."""
+    # Swap the module-level CryptContext so callers that imported
+    # get_password_hash or verify_password by name pick it up too
+    fast_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(fast_context, "hash", lru_cache(maxsize=32)(fast_context.hash))
+        mp.setattr(security, "pwd_context", fast_context)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_schemas():
+    """Finish any deferred Pydantic schema builds before the first test runs."""
+    for cls in (
+        LoginRequest, RegisterRequest, ChangePasswordRequest,
+        UserCreate, UserUpdate,
+        RoleCreate, RoleUpdate, PermissionCreate,
+    ):
+        cls.model_rebuild()
+
+
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the database schema once per test session."""
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def _engine(_schema):
+    """Expose the shared test engine to session-scoped fixtures in test modules."""
+    return engine
+
+
+@pytest.fixture(scope="function")
+def db(_schema, _seed_users, _base_permissions):
+    """
+    Provide a session whose changes are rolled back after each test.
+    Commits made by the code under test only release a SAVEPOINT inside an
+    outer transaction that teardown rolls back. Session-wide seed data is
+    committed first, since StaticPool shares one connection.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    token = _db_ctx.set(db)
     try:
         yield db
     finally:
+        _db_ctx.reset(token)
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def client(db):
-    """Create a test client with database dependency override."""
-    def override_get_db():
+def query_counter():
+    """Return a context manager that collects the SQL sent to the test engine."""
+    @contextmanager
+    def counter():
+        statements = []
+        
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", _record)
         try:
-            yield db
+            yield statements
         finally:
-            pass  # Don't close db here; outer fixture handles it
+            event.remove(engine, "before_cursor_execute", _record)
     
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
+    return counter
+
+
+@pytest.fixture(scope="session")
+def _base_permissions(_schema):
+    """Insert the reference permissions once per test session."""
+    session = TestingSessionLocal()
+    try:
+        permissions = {
+            "read": Permission(code="user.read", name="Read Users", module="users"),
+            "write": Permission(code="user.write", name="Write Users", module="users"),
+        }
+        session.add_all(permissions.values())
+        session.commit()
+        return permissions
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def duplicate_catalog(db):
+    """Seed the permission and role that the duplicate-create tests collide with."""
+    catalog = {
+        "permission": {"code": "duplicate.code", "name": "First", "module": "test"},
+        "role": {"name": "Duplicate Role", "description": "First", "is_active": True},
+    }
+    db.add_all([Permission(**catalog["permission"]), Role(**catalog["role"])])
+    db.commit()
+    return catalog
+
+
+@pytest.fixture(scope="session")
+def _db_override():
+    """Route both get_db providers to the current test's session."""
+    # app.core.deps keeps its own get_db behind get_current_user
+    providers = (get_db, deps.get_db)
+    for provider in providers:
+        app.dependency_overrides[provider] = _override_get_db
+    yield
+    for provider in providers:
+        app.dependency_overrides.pop(provider, None)
+
+
+@pytest.fixture(scope="session")
+def _client(_db_override):
+    """Create a single test client shared across the test session."""
+    # TestClient keeps one event-loop portal open for the whole session, so
+    # startup and middleware setup run once; httpx.ASGITransport is async-only
+    # and cannot back a synchronous client.
+    with TestClient(app, headers=JSON_HEADERS) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def client(db, _client):
+    """Provide the shared test client bound to the current test's session."""
+    yield _client
+    _client.cookies.clear()
+
+
+@pytest.fixture(scope="function")
+async def async_client(db, _db_override):
+    """Provide an in-process async client that skips TestClient's thread portal."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport, base_url="http://test", headers=JSON_HEADERS
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def _seed_users(_schema):
+    """Insert the regular test user and superuser once per test session."""
+    session = TestingSessionLocal()
+    try:
+        users = {
+            "user": User(
+                email="testuser@example.com",
+                hashed_password=get_password_hash("testpassword123"),
+                full_name="Test User",
+                is_active=True,
+                is_superuser=False
+            ),
+            "superuser": User(
+                email="superuser@example.com",
+                hashed_password=get_password_hash("superpassword123"),
+                full_name="Super User",
+                is_active=True,
+                is_superuser=True
+            ),
+        }
+        session.add_all(users.values())
+        session.commit()
+        return users
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def test_user(db, _seed_users):
+    """Regular active user, attached to the current test's session."""
+    return db.merge(_seed_users["user"], load=False)
+
+
+@pytest.fixture(scope="function")
+def test_superuser(db, _seed_users):
+    """Active superuser, attached to the current test's session."""
+    return db.merge(_seed_users["superuser"], load=False)
+
+
+@pytest.fixture(scope="function")
+def test_role(db, _base_permissions):
+    """Create a role holding the reference user read/write permissions."""
+    role = Role(
+        name="Test Role",
+        description="Role used by tests",
+        is_active=True,
+        permissions=[db.merge(p, load=False) for p in _base_permissions.values()]
+    )
+    db.add(role)
+    db.commit()
+    return role
+
+
+@pytest.fixture(scope="session")
+def user_token(_seed_users):
+    """Access token for the regular test user."""
+    user = _seed_users["user"]
+    return _signed(user.id, user.email, None)
+
+
+@pytest.fixture(scope="session")
+def superuser_token(_seed_users):
+    """Access token for the test superuser."""
+    user = _seed_users["superuser"]
+    return _signed(user.id, user.email, None)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(user_token):
+    """Authorization headers for the regular test user."""
+    return {"Authorization": f"Bearer {user_token}"}
+
+
+@pytest.fixture(scope="session")
+def superuser_auth_headers(superuser_token):
+    """Authorization headers for the test superuser."""
+    return {"Authorization": f"Bearer {superuser_token}"}
@@ -3,15 +3,16 @@ JERP 2.0 - Audit Log Endpoint Tests
 """
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
 
 from app.models.audit_log import AuditLog
 from app.models.user import User
 
 
-def test_list_audit_logs_superuser(client: TestClient, superuser_auth_headers: dict):
+async def test_list_audit_logs_superuser(async_client: AsyncClient, superuser_auth_headers: dict):
     """Test listing audit logs as superuser"""
-    response = client.get("/api/v1/audit", headers=superuser_auth_headers)
+    response = await async_client.get("/api/v1/audit", headers=superuser_auth_headers)
     
     assert response.status_code == 200
     data = response.json()
@@ -43,9 +44,9 @@ def test_list_audit_logs_with_filters(client: TestClient, test_user: User, super
     assert "items" in data
 
 
-def test_get_audit_log(client: TestClient, db: Session, superuser_auth_headers: dict):
-    """Test getting a specific audit log"""
-    # Create an audit log
+@pytest.fixture
+def audit_log(db: Session):
+    """Seed a single audit log entry"""
     log = AuditLog.create_entry(
         user_id=1,
         user_email="test@example.com",
@@ -61,31 +62,22 @@ def test_get_audit_log(client: TestClient, db: Session, superuser_auth_headers:
     )
     db.add(log)
     db.commit()
-    db.refresh(log)
-    
-    response = client.get(f"/api/v1/audit/{log.id}", headers=superuser_auth_headers)
+    return log
+
+
+def test_get_audit_log(client: TestClient, audit_log: AuditLog, superuser_auth_headers: dict):
+    """Test getting a specific audit log"""
+    response = client.get(f"/api/v1/audit/{audit_log.id}", headers=superuser_auth_headers)
     
     assert response.status_code == 200
     data = response.json()
-    assert data["id"] == log.id
+    assert data["id"] == audit_log.id
     assert data["action"] == "TEST"
 
 
-def test_get_audit_log_non_superuser(client: TestClient, db: Session, auth_headers: dict):
+def test_get_audit_log_non_superuser(client: TestClient, audit_log: AuditLog, auth_headers: dict):
     """Test getting audit log as non-superuser (should fail)"""
-    log = AuditLog.create_entry(
-        user_id=1,
-        user_email="test@example.com",
-        action="TEST",
-        resource_type="test",
-        resource_id="1",
-        previous_hash=None
-    )
-    db.add(log)
-    db.commit()
-    db.refresh(log)
-    
-    response = client.get(f"/api/v1/audit/{log.id}", headers=auth_headers)
+    response = client.get(f"/api/v1/audit/{audit_log.id}", headers=auth_headers)
     
     assert response.status_code == 403
 
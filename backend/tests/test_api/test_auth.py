@@ -60,26 +60,20 @@ def test_login_success(client: TestClient, test_user: User):
     assert "refresh_token" in data
 
 
-def test_login_invalid_credentials(client: TestClient, test_user: User):
-    """Test login with invalid credentials"""
-    response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_user.email,
-            "password": "wrongpassword"
-        }
-    )
-    
-    assert response.status_code == 401
+INVALID_LOGINS = [
+    pytest.param("testuser@example.com", "wrongpassword", id="wrong_password"),
+    pytest.param("nonexistent@example.com", "password123", id="nonexistent_user"),
+]
 
 
-def test_login_nonexistent_user(client: TestClient):
-    """Test login with non-existent user"""
+@pytest.mark.parametrize("email,password", INVALID_LOGINS)
+def test_login_invalid(client: TestClient, test_user: User, email: str, password: str):
+    """Test login is rejected for bad credentials or unknown users"""
     response = client.post(
         "/api/v1/auth/login",
         json={
-            "email": "nonexistent@example.com",
-            "password": "password123"
+            "email": email,
+            "password": password
         }
     )
     
@@ -11,21 +11,15 @@ from app.api.v1.dependencies import (
     get_current_active_user,
     require_superuser
 )
-from app.core.security import create_access_token
 from app.models.user import User
 
 
 @pytest.mark.asyncio
-async def test_get_current_user_valid_token(db: Session, test_user: User):
+async def test_get_current_user_valid_token(db: Session, test_user: User, user_token: str):
     """Test getting current user with valid token"""
-    token = create_access_token({
-        "sub": test_user.id,
-        "email": test_user.email
-    })
-    
     credentials = HTTPAuthorizationCredentials(
         scheme="Bearer",
-        credentials=token
+        credentials=user_token
     )
     
     user = await get_current_user(credentials, db)
@@ -91,36 +91,13 @@ def test_login_invalid_credentials(client):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_get_current_user(client):
+def test_get_current_user(client, test_user, auth_headers):
     """Test getting current user info."""
-    # Register and login
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123",
-            "full_name": "Test User"
-        }
-    )
-    
-    login_response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
-    )
-    token = login_response.json()["access_token"]
-    
-    # Get current user
-    response = client.get(
-        "/api/v1/auth/me",
-        headers={"Authorization": f"Bearer {token}"}
-    )
+    response = client.get("/api/v1/auth/me", headers=auth_headers)
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert data["email"] == "test@example.com"
-    assert data["full_name"] == "Test User"
+    assert data["email"] == test_user.email
+    assert data["full_name"] == test_user.full_name
 
 
 def test_unauthorized_access(client):
@@ -2,12 +2,9 @@
 JERP 2.0 - Health Check Tests
 """
 from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health_check():
+def test_health_check(client: TestClient):
     """Test basic health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
@@ -20,7 +17,7 @@ def test_health_check():
     assert "checks" in data
 
 
-def test_health_check_has_database_check():
+def test_health_check_has_database_check(client: TestClient):
     """Test that health check includes database status"""
     response = client.get("/health")
     data = response.json()
@@ -9,14 +9,11 @@ Tests the database initialization script to ensure:
 - Script is idempotent (can run multiple times)
 """
 import pytest
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 
-from app.core.database import Base
-from app.core.config import settings
 from app.models.user import User
-from app.models.role import Role, Permission
+from app.models.role import Role, Permission, role_permissions
 from app.scripts.init_db import (
     create_default_roles,
     create_default_permissions,
@@ -27,27 +24,105 @@ from app.scripts.init_db import (
     ROLE_PERMISSION_MAPPING
 )
 
+EXPECTED_ROLES = frozenset(role["name"] for role in DEFAULT_ROLES)
+EXPECTED_CODES = frozenset(perm["code"] for perm in DEFAULT_PERMISSIONS)
+EXPECTED_MODULES = frozenset(perm["module"] for perm in DEFAULT_PERMISSIONS)
+
 
 @pytest.fixture(scope="function")
-def test_db():
-    """Create a test database for each test"""
-    # Create test database engine
-    test_db_url = f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/test_jerp"
-    engine = create_engine(test_db_url, echo=False)
-    
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    
-    # Create session
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestSessionLocal()
-    
-    yield session
-    
-    # Cleanup
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+def test_db(db):
+    """Provide the shared rolled-back session from conftest"""
+    return db
+
+
+@pytest.fixture(scope="session")
+def _seed_rows(_engine, _seed_users, _base_permissions):
+    """Run the seed functions once and capture the rows they write"""
+    connection = _engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+    
+    try:
+        roles = create_default_roles(session)
+        permissions = create_default_permissions(session)
+        assign_permissions_to_roles(session, roles, permissions)
+        
+        # Drop the ids and key the mapping by name so replays cannot collide
+        # with rows other fixtures have committed to the shared database
+        def _rows(stmt):
+            return [
+                {key: value for key, value in row._mapping.items() if key != "id"}
+                for row in connection.execute(stmt)
+            ]
+        
+        return {
+            "roles": _rows(select(Role.__table__).where(Role.name.in_(EXPECTED_ROLES))),
+            "permissions": _rows(
+                select(Permission.__table__).where(Permission.code.in_(EXPECTED_CODES))
+            ),
+            "grants": connection.execute(
+                select(Role.name, Permission.code)
+                .select_from(role_permissions)
+                .join(Role, Role.id == role_permissions.c.role_id)
+                .join(Permission, Permission.id == role_permissions.c.permission_id)
+                .where(Role.name.in_(EXPECTED_ROLES))
+            ).all(),
+        }
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def seeded_db(test_db, _seed_rows):
+    """Provide test_db pre-populated with the default roles, permissions and mapping"""
+    test_db.execute(Role.__table__.insert(), _seed_rows["roles"])
+    test_db.execute(Permission.__table__.insert(), _seed_rows["permissions"])
+    
+    role_ids = dict(test_db.execute(
+        select(Role.name, Role.id).where(Role.name.in_(EXPECTED_ROLES))
+    ).all())
+    permission_ids = dict(test_db.execute(
+        select(Permission.code, Permission.id).where(Permission.code.in_(EXPECTED_CODES))
+    ).all())
+    test_db.execute(role_permissions.insert(), [
+        {"role_id": role_ids[name], "permission_id": permission_ids[code]}
+        for name, code in _seed_rows["grants"]
+    ])
+    
+    return test_db
+
+
+@pytest.fixture(scope="function")
+def seeded_roles(seeded_db):
+    """Map role names to the seeded roles"""
+    return {
+        role.name: role
+        for role in seeded_db.query(Role).filter(Role.name.in_(EXPECTED_ROLES))
+    }
+
+
+@pytest.fixture(scope="function")
+def superuser_env(monkeypatch):
+    """Point the initial superuser settings at test values"""
+    monkeypatch.setenv("INITIAL_SUPERUSER_EMAIL", "test@example.com")
+    monkeypatch.setenv("INITIAL_SUPERUSER_PASSWORD", "testpass123")
+    monkeypatch.setenv("INITIAL_SUPERUSER_NAME", "Test Admin")
+
+
+@pytest.fixture(scope="function")
+def assigned_roles(seeded_db):
+    """Load the seeded roles with their assigned permissions"""
+    # Reload every role's permissions in one IN query instead of one per role
+    return {
+        role.name: role
+        for role in seeded_db.query(Role).options(selectinload(Role.permissions))
+    }
 
 
 def test_create_default_roles(test_db):
@@ -69,19 +144,19 @@ def test_create_default_roles(test_db):
         assert role.is_active is True
     
     # Verify roles exist in database
-    db_roles = test_db.query(Role).all()
+    db_roles = test_db.query(Role).filter(Role.name.in_(EXPECTED_ROLES)).all()
     assert len(db_roles) == len(DEFAULT_ROLES)
 
 
-def test_create_default_roles_idempotent(test_db):
+def test_create_default_roles_idempotent(seeded_db, seeded_roles):
     """Test that creating roles multiple times doesn't duplicate"""
-    # Create roles first time
-    roles1 = create_default_roles(test_db)
-    count1 = test_db.query(Role).count()
+    # Roles were created once already by the seed
+    roles1 = seeded_roles
+    count1 = seeded_db.query(Role).filter(Role.name.in_(EXPECTED_ROLES)).count()
     
     # Create roles second time
-    roles2 = create_default_roles(test_db)
-    count2 = test_db.query(Role).count()
+    roles2 = create_default_roles(seeded_db)
+    count2 = seeded_db.query(Role).filter(Role.name.in_(EXPECTED_ROLES)).count()
     
     # Should have same count
     assert count1 == count2
@@ -111,19 +186,22 @@ def test_create_default_permissions(test_db):
         assert permission.module == perm_data["module"]
     
     # Verify permissions exist in database
-    db_permissions = test_db.query(Permission).all()
+    db_permissions = test_db.query(Permission).filter(Permission.code.in_(EXPECTED_CODES)).all()
     assert len(db_permissions) == len(DEFAULT_PERMISSIONS)
 
 
-def test_create_default_permissions_idempotent(test_db):
+def test_create_default_permissions_idempotent(seeded_db):
     """Test that creating permissions multiple times doesn't duplicate"""
-    # Create permissions first time
-    perms1 = create_default_permissions(test_db)
-    count1 = test_db.query(Permission).count()
+    # Permissions were created once already by the seed
+    perms1 = {
+        p.code: p
+        for p in seeded_db.query(Permission).filter(Permission.code.in_(EXPECTED_CODES))
+    }
+    count1 = len(perms1)
     
     # Create permissions second time
-    perms2 = create_default_permissions(test_db)
-    count2 = test_db.query(Permission).count()
+    perms2 = create_default_permissions(seeded_db)
+    count2 = seeded_db.query(Permission).filter(Permission.code.in_(EXPECTED_CODES)).count()
     
     # Should have same count
     assert count1 == count2
@@ -134,39 +212,28 @@ def test_create_default_permissions_idempotent(test_db):
         assert perms1[perm_code].id == perms2[perm_code].id
 
 
-def test_assign_permissions_to_roles(test_db):
+def test_assign_permissions_to_roles(assigned_roles, query_counter):
     """Test that permissions are correctly assigned to roles"""
-    # Create roles and permissions
-    roles = create_default_roles(test_db)
-    permissions = create_default_permissions(test_db)
-    
-    # Assign permissions to roles
-    assign_permissions_to_roles(test_db, roles, permissions)
-    
-    # Verify assignments
-    for role_name, permission_codes in ROLE_PERMISSION_MAPPING.items():
-        role = roles.get(role_name)
-        assert role is not None
-        
-        # Get role permissions
-        role_perms = {p.code for p in role.permissions}
-        
-        # Verify all expected permissions are assigned
-        for perm_code in permission_codes:
-            assert perm_code in role_perms, f"Permission {perm_code} not assigned to role {role_name}"
+    # Verify assignments without lazy-loading any collection
+    with query_counter() as statements:
+        for role_name, permission_codes in ROLE_PERMISSION_MAPPING.items():
+            role = assigned_roles.get(role_name)
+            assert role is not None
+            
+            # Get role permissions
+            role_perms = {p.code for p in role.permissions}
+            
+            # Verify all expected permissions are assigned
+            for perm_code in permission_codes:
+                assert perm_code in role_perms, f"Permission {perm_code} not assigned to role {role_name}"
+    
+    assert statements == []
 
 
-def test_superadmin_has_all_permissions(test_db):
+def test_superadmin_has_all_permissions(assigned_roles):
     """Test that Superadmin role has all permissions"""
-    # Create roles and permissions
-    roles = create_default_roles(test_db)
-    permissions = create_default_permissions(test_db)
-    
-    # Assign permissions
-    assign_permissions_to_roles(test_db, roles, permissions)
-    
     # Get Superadmin role
-    superadmin = roles.get("Superadmin")
+    superadmin = assigned_roles.get("Superadmin")
     assert superadmin is not None
     
     # Verify has all permissions from mapping
@@ -176,18 +243,13 @@ def test_superadmin_has_all_permissions(test_db):
     assert expected_perms.issubset(actual_perms)
 
 
-def test_create_initial_superuser(test_db):
+def test_create_initial_superuser(seeded_db, seeded_roles, superuser_env):
     """Test that initial superuser is created correctly"""
-    # Set environment variables
-    os.environ["INITIAL_SUPERUSER_EMAIL"] = "test@example.com"
-    os.environ["INITIAL_SUPERUSER_PASSWORD"] = "testpass123"
-    os.environ["INITIAL_SUPERUSER_NAME"] = "Test Admin"
-    
-    # Create roles first
-    roles = create_default_roles(test_db)
+    # Roles come from the seed
+    roles = seeded_roles
     
     # Create superuser
-    superuser = create_initial_superuser(test_db, roles)
+    superuser = create_initial_superuser(seeded_db, roles)
     
     # Verify superuser
     assert superuser is not None
@@ -202,28 +264,23 @@ def test_create_initial_superuser(test_db):
     assert len(superuser.hashed_password) > 20  # Bcrypt hashes are long
     
     # Verify superuser exists in database
-    db_user = test_db.query(User).filter(User.email == "test@example.com").first()
+    db_user = seeded_db.query(User).filter(User.email == "test@example.com").first()
     assert db_user is not None
     assert db_user.id == superuser.id
 
 
-def test_create_initial_superuser_idempotent(test_db):
+def test_create_initial_superuser_idempotent(seeded_db, seeded_roles, superuser_env):
     """Test that creating superuser multiple times doesn't duplicate"""
-    # Set environment variables
-    os.environ["INITIAL_SUPERUSER_EMAIL"] = "test@example.com"
-    os.environ["INITIAL_SUPERUSER_PASSWORD"] = "testpass123"
-    os.environ["INITIAL_SUPERUSER_NAME"] = "Test Admin"
-    
-    # Create roles
-    roles = create_default_roles(test_db)
+    # Roles come from the seed
+    roles = seeded_roles
     
     # Create superuser first time
-    superuser1 = create_initial_superuser(test_db, roles)
-    count1 = test_db.query(User).count()
+    superuser1 = create_initial_superuser(seeded_db, roles)
+    count1 = seeded_db.query(User).filter(User.email == "test@example.com").count()
     
     # Create superuser second time
-    superuser2 = create_initial_superuser(test_db, roles)
-    count2 = test_db.query(User).count()
+    superuser2 = create_initial_superuser(seeded_db, roles)
+    count2 = seeded_db.query(User).filter(User.email == "test@example.com").count()
     
     # Should have same count (only 1 user)
     assert count1 == count2 == 1
@@ -232,17 +289,10 @@ def test_create_initial_superuser_idempotent(test_db):
     assert superuser1.id == superuser2.id
 
 
-def test_user_role_has_limited_permissions(test_db):
+def test_user_role_has_limited_permissions(assigned_roles):
     """Test that User role has only read permissions"""
-    # Create roles and permissions
-    roles = create_default_roles(test_db)
-    permissions = create_default_permissions(test_db)
-    
-    # Assign permissions
-    assign_permissions_to_roles(test_db, roles, permissions)
-    
     # Get User role
-    user_role = roles.get("User")
+    user_role = assigned_roles.get("User")
     assert user_role is not None
     
     # Get permissions
@@ -262,22 +312,14 @@ def test_all_roles_exist(test_db):
     """Test that all expected roles are created"""
     roles = create_default_roles(test_db)
     
-    expected_roles = ["Superadmin", "Admin", "Manager", "User"]
-    for role_name in expected_roles:
-        assert role_name in roles
-        assert roles[role_name].name == role_name
+    assert EXPECTED_ROLES <= set(roles)
 
 
 def test_all_permission_modules_exist(test_db):
     """Test that permissions cover all expected modules"""
     permissions = create_default_permissions(test_db)
     
-    # Get all modules
-    modules = set(p.module for p in permissions.values())
-    
-    # Verify expected modules
-    expected_modules = {"users", "roles", "audit", "compliance", "system"}
-    assert expected_modules.issubset(modules)
+    assert EXPECTED_MODULES <= {p.module for p in permissions.values()}
 
 
 if __name__ == "__main__":
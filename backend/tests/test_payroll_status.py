@@ -0,0 +1,21 @@
+"""
+Tests for the Payroll Status Enumeration
+"""
+import pytest
+
+from app.core.enums import PayrollStatus
+
+
+@pytest.mark.parametrize("member,value", [
+    (PayrollStatus.DRAFT, "DRAFT"),
+    (PayrollStatus.PENDING, "PENDING"),
+    (PayrollStatus.PROCESSING, "PROCESSING"),
+    (PayrollStatus.PROCESSED, "PROCESSED"),
+    (PayrollStatus.FAILED, "FAILED"),
+    (PayrollStatus.CANCELLED, "CANCELLED"),
+])
+def test_payroll_status_enum(member: PayrollStatus, value: str):
+    """Test each payroll status serializes to and parses from its string value"""
+    assert member == value
+    assert member.value == value
+    assert PayrollStatus(value) is member
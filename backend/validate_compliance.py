@@ -5,86 +5,123 @@ Quick validation script for the compliance framework
 import sys
 sys.path.insert(0, '/home/runner/work/JERP-2.0/JERP-2.0/backend')
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from app.services.compliance import california_labor_code, flsa, gaap, ifrs
 
-print("=" * 80)
-print("JERP 2.0 Compliance Framework Validation")
-print("=" * 80)
-
-# Test 1: California Labor Code - Overtime
-print("\n1. California Labor Code - Overtime Calculation")
-print("-" * 80)
-hours = {"2024-01-01": 10, "2024-01-02": 12, "2024-01-03": 8}
-workweek = [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)]
-result = california_labor_code.calculate_overtime(hours, workweek)
-print(f"   Regular hours: {result['regular_hours']}")
-print(f"   Overtime 1.5x: {result['overtime_1_5x_hours']}")
-print(f"   Overtime 2x: {result['overtime_2x_hours']}")
-print(f"   ✓ California overtime calculation working")
-
-# Test 2: FLSA - Minimum Wage
-print("\n2. FLSA - Minimum Wage Validation")
-print("-" * 80)
-pay = Decimal("400.00")
-hours = 40.0
-result = flsa.validate_minimum_wage(pay, hours, "regular")
-print(f"   Pay: ${pay}")
-print(f"   Hours: {hours}")
-print(f"   Effective rate: ${result['effective_rate']:.2f}/hr")
-print(f"   Minimum required: ${result['minimum_required']:.2f}/hr")
-print(f"   Compliant: {result['compliant']}")
-print(f"   ✓ FLSA minimum wage validation working")
-
-# Test 3: GAAP - Journal Entry
-print("\n3. GAAP - Journal Entry Validation")
-print("-" * 80)
-entry = {
-    "date": "2024-01-15",
-    "description": "Record payment",
-    "debits": [{"account": "Cash", "amount": 5000.00}],
-    "credits": [{"account": "Accounts Receivable", "amount": 5000.00}]
-}
-result = gaap.validate_journal_entry(entry)
-print(f"   Debits: ${result['total_debits']}")
-print(f"   Credits: ${result['total_credits']}")
-print(f"   Balanced: {abs(result['balance']) < 0.01}")
-print(f"   Compliant: {result['compliant']}")
-print(f"   ✓ GAAP journal entry validation working")
-
-# Test 4: IFRS 15 - Revenue Recognition
-print("\n4. IFRS 15 - Revenue Recognition")
-print("-" * 80)
-contract = {
-    "customer_id": 12345,
-    "has_commercial_substance": True,
-    "payment_probable": True,
-    "transaction_price": 10000,
-    "performance_obligations": [
-        {
-            "allocated_price": 10000,
-            "satisfaction_method": "point_in_time",
-            "control_transferred": True
-        }
+
+def run_ca():
+    """California Labor Code - Overtime Calculation"""
+    hours = {"2024-01-01": 10, "2024-01-02": 12, "2024-01-03": 8}
+    workweek = [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)]
+    result = california_labor_code.calculate_overtime(hours, workweek)
+    return "1. California Labor Code - Overtime Calculation", [
+        f"   Regular hours: {result['regular_hours']}",
+        f"   Overtime 1.5x: {result['overtime_1_5x_hours']}",
+        f"   Overtime 2x: {result['overtime_2x_hours']}",
+        f"   ✓ California overtime calculation working",
+    ]
+
+
+def run_flsa():
+    """FLSA - Minimum Wage Validation"""
+    pay = Decimal("400.00")
+    hours = 40.0
+    result = flsa.validate_minimum_wage(pay, hours, "regular")
+    return "2. FLSA - Minimum Wage Validation", [
+        f"   Pay: ${pay}",
+        f"   Hours: {hours}",
+        f"   Effective rate: ${result['effective_rate']:.2f}/hr",
+        f"   Minimum required: ${result['minimum_required']:.2f}/hr",
+        f"   Compliant: {result['compliant']}",
+        f"   ✓ FLSA minimum wage validation working",
+    ]
+
+
+def run_gaap():
+    """GAAP - Journal Entry Validation"""
+    entry = {
+        "date": "2024-01-15",
+        "description": "Record payment",
+        "debits": [{"account": "Cash", "amount": 5000.00}],
+        "credits": [{"account": "Accounts Receivable", "amount": 5000.00}]
+    }
+    result = gaap.validate_journal_entry(entry)
+    return "3. GAAP - Journal Entry Validation", [
+        f"   Debits: ${result['total_debits']}",
+        f"   Credits: ${result['total_credits']}",
+        f"   Balanced: {abs(result['balance']) < 0.01}",
+        f"   Compliant: {result['compliant']}",
+        f"   ✓ GAAP journal entry validation working",
+    ]
+
+
+def run_ifrs():
+    """IFRS 15 - Revenue Recognition"""
+    contract = {
+        "customer_id": 12345,
+        "has_commercial_substance": True,
+        "payment_probable": True,
+        "transaction_price": 10000,
+        "performance_obligations": [
+            {
+                "allocated_price": 10000,
+                "satisfaction_method": "point_in_time",
+                "control_transferred": True
+            }
+        ]
+    }
+    result = ifrs.validate_ifrs15_revenue(contract)
+    return "4. IFRS 15 - Revenue Recognition", [
+        f"   Transaction price: ${contract['transaction_price']}",
+        f"   Revenue recognizable: ${result['revenue_recognizable']}",
+        f"   Compliant: {result['compliant']}",
+        f"   ✓ IFRS 15 revenue recognition working",
     ]
-}
-result = ifrs.validate_ifrs15_revenue(contract)
-print(f"   Transaction price: ${contract['transaction_price']}")
-print(f"   Revenue recognizable: ${result['revenue_recognizable']}")
-print(f"   Compliant: {result['compliant']}")
-print(f"   ✓ IFRS 15 revenue recognition working")
-
-print("\n" + "=" * 80)
-print("✓ ALL COMPLIANCE ENGINES VALIDATED SUCCESSFULLY")
-print("=" * 80)
-print("\nCompliance Framework Features:")
-print("  • California Labor Code: Overtime, meal breaks, rest breaks")
-print("  • Federal FLSA: Overtime, minimum wage, child labor")
-print("  • GAAP: Balance sheet, journal entries, revenue, depreciation")
-print("  • IFRS: Revenue (IFRS 15), leases (IFRS 16), fair value, impairment")
-print("  • 62 unit tests passing with 84-91% coverage on core engines")
-print("  • RESTful API endpoints for all compliance operations")
-print("  • Violation tracking with auto-escalation")
-print("  • Immutable audit logging integration")
-print("=" * 80)
+
+
+CHECKS = (run_ca, run_flsa, run_gaap, run_ifrs)
+
+SEP = "=" * 80
+RULE = "-" * 80
+
+
+def main():
+    # The engines are independent and share no state, so run them together
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+        results = list(executor.map(lambda check: check(), CHECKS))
+    
+    out = [
+        SEP,
+        "JERP 2.0 Compliance Framework Validation",
+        SEP,
+    ]
+    
+    for label, lines in results:
+        out.append(f"\n{label}")
+        out.append(RULE)
+        out.extend(lines)
+    
+    out += [
+        "\n" + SEP,
+        "✓ ALL COMPLIANCE ENGINES VALIDATED SUCCESSFULLY",
+        SEP,
+        "\nCompliance Framework Features:",
+        "  • California Labor Code: Overtime, meal breaks, rest breaks",
+        "  • Federal FLSA: Overtime, minimum wage, child labor",
+        "  • GAAP: Balance sheet, journal entries, revenue, depreciation",
+        "  • IFRS: Revenue (IFRS 15), leases (IFRS 16), fair value, impairment",
+        "  • 62 unit tests passing with 84-91% coverage on core engines",
+        "  • RESTful API endpoints for all compliance operations",
+        "  • Violation tracking with auto-escalation",
+        "  • Immutable audit logging integration",
+        SEP,
+    ]
+    
+    # One write instead of a flush per line
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()